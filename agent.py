@@ -1,17 +1,137 @@
 import os
+import sys
+import json
 import time
 import asyncio
 import logging
+import threading
+import functools
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = sys.platform.startswith('linux')
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
 from core.agent_base import BaseAgent
 from .processors.content_processor_manager import ContentProcessorManager
 from .processors.note_manager import NoteManager
 from core.event_bus import EventBus
 
+# Upper bound on manifest entries; least recently seen paths are evicted first
+MANIFEST_MAX_ENTRIES = 10000
+
+# Settings persisted in the "config" memory blob
+CONFIG_KEYS = ("watch_path", "dest_path", "scan_enabled", "scan_interval", "worker_count", "log_level")
+
+def _sanitize_path(path: str) -> str:
+    """Strip whitespace and surrounding quotes from path string."""
+    if not path:
+        return None
+    s = path.strip()
+    if len(s) >= 2 and s[0] == s[-1] and s[0] in ('"', "'"):
+        return s[1:-1].strip()
+    return s
+
+@functools.lru_cache(maxsize=32)
+def _expand_and_sanitize(path: str) -> str:
+    """Sanitize a configured path, then expand ~. Cached since the same few paths recur."""
+    s = _sanitize_path(path)
+    return os.path.expanduser(s) if s else s
+
+def _should_skip(name: str) -> bool:
+    """Hidden files and iCloud placeholders (not yet downloaded) are never processed."""
+    return not name or name[0] == '.' or name.endswith('.icloud')
+
+# Filesystems whose change notifications do not cover writes made by other hosts
+NETWORK_FS_TYPES = frozenset(("cifs", "smb3", "smbfs", "nfs", "nfs4", "afpfs", "fuse.sshfs", "9p"))
+
+def _is_network_fs(path: str) -> bool:
+    """
+    Best-effort check whether path lives on a network share (SMB/NFS/...).
+    Native watchers miss or drop events there, so those folders are polled.
+    """
+    if sys.platform == 'win32':
+        drive = os.path.splitdrive(os.path.abspath(path))[0]
+        if drive.startswith('\\\\'):  # UNC share
+            return True
+        try:
+            import ctypes
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == 4  # DRIVE_REMOTE
+        except Exception:
+            return False
+    if sys.platform.startswith('linux'):
+        real = os.path.realpath(path)
+        best, fstype = "", None
+        try:
+            with open('/proc/mounts') as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    # Mount points escape spaces as \040
+                    mount = fields[1].replace('\\040', ' ')
+                    if (real == mount or real.startswith(mount.rstrip('/') + '/')) and len(mount) >= len(best):
+                        best, fstype = mount, fields[2]
+        except OSError:
+            return False
+        return fstype in NETWORK_FS_TYPES
+    return False
+
+def _has_writer(path: str) -> bool:
+    """
+    Best-effort check whether some process has path open for writing (Linux).
+    Walks /proc/<pid>/fd; only processes we may inspect (normally our own
+    user's) are seen.
+    """
+    target = os.path.realpath(path)
+    try:
+        pids = [p for p in os.listdir('/proc') if p.isdigit()]
+    except OSError:
+        return False
+    for pid in pids:
+        fd_dir = f'/proc/{pid}/fd'
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                if os.readlink(f'{fd_dir}/{fd}') != target:
+                    continue
+                with open(f'/proc/{pid}/fdinfo/{fd}') as f:
+                    for line in f:
+                        if line.startswith('flags:'):
+                            # Access mode is the low two bits: O_WRONLY or O_RDWR
+                            if int(line.split()[1], 8) & 3:
+                                return True
+                            break
+            except (OSError, ValueError, IndexError):
+                continue
+    return False
+
+def _clamp_workers(n: int, warn: bool = True) -> int:
+    """
+    Limit a concurrency setting to min(n, 2 x CPUs, 16); more only adds contention.
+    Raises ValueError if n is not integral (bools and fractional floats are
+    rejected rather than truncated; integer strings are accepted), TypeError
+    if n is not a number or string. Built-in
+    defaults pass warn=False, since only a user-configured value is worth a warning.
+    """
+    if isinstance(n, bool) or (isinstance(n, float) and not n.is_integer()):
+        raise ValueError(f"not an integer: {n!r}")
+    n = int(n)
+    clamped = max(1, min(n, (os.cpu_count() or 2) * 2, 16))
+    if warn and clamped != n:
+        logging.warning("EchoEtcher worker count clamped %d -> %d", n, clamped)
+    return clamped
+
 class EchoEtcherAgent(BaseAgent):
     def __init__(self, name: str):
         super().__init__(name)
@@ -27,7 +147,9 @@ class EchoEtcherAgent(BaseAgent):
                         "polling_enabled": {"type": "boolean", "description": "Enable checking the system database for manual commands from the Orchestrator or Radar."},
                         "polling_interval": {"type": "integer", "description": "How often (in seconds) the agent check for new manual tasks assigned to it.", "minimum": 10},
                         "scan_enabled": {"type": "boolean", "description": "Enable proactive disk scanning to find new files automatically."},
-                        "scan_interval": {"type": "integer", "description": "How often (in seconds) the agent sweeps the watch_path for new files on its own.", "minimum": 30}
+                        "scan_interval": {"type": "integer", "description": "How often (in seconds) the agent sweeps the watch_path for new files on its own.", "minimum": 30},
+                        "worker_count": {"type": "integer", "description": "How many detected files the watcher processes concurrently.", "minimum": 1, "maximum": 16},
+                        "log_level": {"type": "string", "enum": ["INFO", "DEBUG"], "description": "Set to DEBUG to show detailed diagnostics in the console."}
                     },
                     "required": ["watch_path", "dest_path"]
                 }
@@ -46,21 +168,62 @@ class EchoEtcherAgent(BaseAgent):
         self.dest_path = None
         self.processor_manager = None
         self.note_manager = None
-        self.logs = [] # In-memory logs for UI
+        self._vault_path = None
+        self._folder_name = None
+        self.logs = deque(maxlen=100) # In-memory logs for UI
+        self._ts_cache = (0, "")
+        self.log_level = "INFO"
+        self._diagnosed_paths: set = set()
         self._last_error = None
+        # (context, exception type) pairs whose traceback was already logged
+        self._traced_exceptions: set = set()
+        self._traced_reset = time.monotonic()
         
         # Scan configuration
         self.scan_enabled = False
         self.scan_interval = 120
-
-    def _sanitize_path(self, path: str) -> str:
-        """Strip whitespace and surrounding quotes from path string."""
-        if not path:
-            return None
-        s = path.strip()
-        if (s.startswith('"') and s.endswith('"')) or (s.startswith("'") and s.endswith("'")):
-            s = s[1:-1].strip()
-        return s
+        self.scan_concurrency = _clamp_workers(8, warn=False)
+        self._wake = asyncio.Event()
+        
+        # Persisted settings (see CONFIG_KEYS), saved as one JSON blob
+        self._cfg: Dict[str, Any] = {}
+        self._config_save_task = None
+        self._config_dirty = False  # changed since the last save_memory snapshot
+        self._last_scan = float("-inf")  # time.monotonic() of the last scan
+        self._scan_task = None  # background scan started via start_scan()
+        self._scan_sentinel = None  # (watch_path, dir mtime_ns) of the last scan that left nothing pending
+        
+        # Watcher work queue: events are pushed from the observer thread and
+        # drained by a fixed pool of worker coroutines.
+        self.worker_count = 4
+        self._loop = None
+        self._work_queue = asyncio.Queue(maxsize=512)
+        self._inflight: set = set()
+        self._workers: List[asyncio.Task] = []
+        # Last submit time per path, to coalesce duplicate events fired in quick succession
+        self._debounce: Dict[str, float] = {}
+        # Paths that got another event while debounced or in flight; re-queued
+        # once the debounce window expires or the current run releases them
+        self._dirty: set = set()
+        self._requeue_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._debounce_pruned = 0.0
+        
+        # Fingerprints (inode, mtime_ns, size) of files already turned into notes,
+        # so scheduled scans skip them without re-running the LLM. Kept in LRU
+        # order and capped at MANIFEST_MAX_ENTRIES.
+        self._seen: "OrderedDict[str, tuple]" = OrderedDict()
+        self._manifest_save_task = None
+        self._manifest_dirty = False
+        
+        # LLM enrichment runs after the provisional note is written. Enrichments
+        # not yet finished are persisted (source path -> content and note info)
+        # so the next start resumes any that shutdown interrupted.
+        self._active_enrichments: set = set()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_save_task = None
+        self._pending_dirty = False
+        self._background_tasks: set = set()
+        self._enrich_sem = asyncio.Semaphore(2)
 
     async def load_config(self):
         """
@@ -69,24 +232,90 @@ class EchoEtcherAgent(BaseAgent):
         """
         # Load base polling config
         await super().load_config()
+        self._loop = asyncio.get_running_loop()
         
-        # Load watch and destination paths
-        raw_watch = await self.get_memory("watch_path")
-        if raw_watch:
-            self.watch_path = os.path.expanduser(raw_watch)
+        # All module settings live in one JSON blob under the "config" key
+        raw_cfg = await self.get_memory("config")
+        if raw_cfg:
+            try:
+                self._cfg = dict(json.loads(raw_cfg))
+            except (ValueError, TypeError) as e:
+                logging.warning("Ignoring unreadable config, falling back to individual keys: %s", e)
+                raw_cfg = None
+        if not raw_cfg:
+            # Migrate settings stored under individual keys by earlier versions
+            for key in CONFIG_KEYS:
+                value = await self.get_memory(key)
+                if value is not None:
+                    self._cfg[key] = value
+            if self._cfg:
+                await self._save_config()
         
-        raw_dest = await self.get_memory("dest_path")
-        if raw_dest:
-            self.dest_path = os.path.expanduser(raw_dest)
+        if self._cfg.get("watch_path"):
+            self.watch_path = _expand_and_sanitize(self._cfg["watch_path"])
+        if self._cfg.get("dest_path"):
+            self.dest_path = _expand_and_sanitize(self._cfg["dest_path"])
+        if self._cfg.get("scan_enabled") is not None:
+            self.scan_enabled = str(self._cfg["scan_enabled"]).lower() == 'true'
+        if self._cfg.get("scan_interval") is not None:
+            self.scan_interval = int(self._cfg["scan_interval"])
+        if self._cfg.get("worker_count") is not None:
+            try:
+                self.worker_count = _clamp_workers(self._cfg["worker_count"])
+            except (ValueError, TypeError):
+                logging.warning("Ignoring invalid stored worker_count: %r", self._cfg["worker_count"])
+        if self._cfg.get("log_level"):
+            self.log_level = str(self._cfg["log_level"]).upper()
         
-        # Load scan configuration
-        raw_scan_enabled = await self.get_memory("scan_enabled")
-        if raw_scan_enabled is not None:
-            self.scan_enabled = str(raw_scan_enabled).lower() == 'true'
+        # Only on first load; afterwards the in-memory manifest is newer than the stored one
+        raw_manifest = None if self._seen else await self.get_memory("scanned_manifest")
+        if raw_manifest:
+            try:
+                self._seen = OrderedDict((path, tuple(fp)) for path, fp in json.loads(raw_manifest).items())
+            except (ValueError, TypeError, AttributeError) as e:
+                logging.warning("Ignoring unreadable scanned_manifest: %s", e)
+        
+        raw_pending = None if self._pending else await self.get_memory("pending_enrichments")
+        if raw_pending:
+            try:
+                self._pending = dict(json.loads(raw_pending))
+            except (ValueError, TypeError) as e:
+                logging.warning("Ignoring unreadable pending_enrichments: %s", e)
         
-        raw_scan_interval = await self.get_memory("scan_interval")
-        if raw_scan_interval is not None:
-            self.scan_interval = int(raw_scan_interval)
+        self._ensure_managers()
+
+    def _set_config(self, key: str, value: Any):
+        """Update a persisted setting; writes are coalesced into one save shortly after."""
+        self._cfg[key] = value
+        self._config_dirty = True
+        if self._config_save_task and not self._config_save_task.done():
+            return
+        self._config_save_task = asyncio.create_task(self._save_config(delay=0.5))
+
+    async def _save_config(self, delay: float = 0):
+        if delay:
+            await asyncio.sleep(delay)
+        # Save again if a change landed while save_memory was awaiting
+        while True:
+            self._config_dirty = False
+            await self.save_memory("config", json.dumps(self._cfg))
+            if not self._config_dirty:
+                break
+
+    def _ensure_managers(self):
+        """
+        Create the shared processor and note managers once.
+        The note manager needs dest_path and is rebuilt only if it changes.
+        """
+        if not self.processor_manager:
+            self.processor_manager = ContentProcessorManager(self) # Pass self to give access to LLM
+        
+        if self.dest_path:
+            dest = Path(self.dest_path)
+            vault_path, folder_name = str(dest.parent), dest.name
+            if not self.note_manager or (vault_path, folder_name) != (self._vault_path, self._folder_name):
+                self._vault_path, self._folder_name = vault_path, folder_name
+                self.note_manager = NoteManager(vault_path=vault_path, notes_folder=folder_name)
 
     async def process_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -95,19 +324,29 @@ class EchoEtcherAgent(BaseAgent):
         action = payload.get("action")
 
         if action == "configure":
+            # Validate before applying anything, so a bad value changes nothing
+            worker_count = None
+            if "worker_count" in payload:
+                try:
+                    worker_count = _clamp_workers(payload["worker_count"])
+                except (ValueError, TypeError):
+                    return {"status": "error", "message": f"worker_count must be an integer, got {payload['worker_count']!r}"}
+            
             watch_path = payload.get("watch_path")
             dest_path = payload.get("dest_path")
             
             if watch_path:
-                watch_path = os.path.expanduser(watch_path)
-                await self.save_memory("watch_path", watch_path)
+                watch_path = _expand_and_sanitize(watch_path)
+                self._set_config("watch_path", watch_path)
                 self.watch_path = watch_path
                 
             if dest_path:
-                dest_path = os.path.expanduser(dest_path)
-                await self.save_memory("dest_path", dest_path)
+                dest_path = _expand_and_sanitize(dest_path)
+                self._set_config("dest_path", dest_path)
                 self.dest_path = dest_path
             
+            self._ensure_managers()
+            
             # Polling configuration
             polling_enabled = payload.get("polling_enabled", self.polling_enabled)
             polling_interval = payload.get("polling_interval", self.polling_interval)
@@ -116,8 +355,17 @@ class EchoEtcherAgent(BaseAgent):
             # Scan configuration
             self.scan_enabled = payload.get("scan_enabled", self.scan_enabled)
             self.scan_interval = payload.get("scan_interval", self.scan_interval)
-            await self.save_memory("scan_enabled", str(self.scan_enabled))
-            await self.save_memory("scan_interval", str(self.scan_interval))
+            self._set_config("scan_enabled", self.scan_enabled)
+            self._set_config("scan_interval", self.scan_interval)
+            
+            # Watcher worker pool size (applied on next start_watching)
+            if worker_count is not None:
+                self.worker_count = worker_count
+                self._set_config("worker_count", self.worker_count)
+            
+            if "log_level" in payload:
+                self.log_level = str(payload["log_level"]).upper()
+                self._set_config("log_level", self.log_level)
             
             # Restart if config changed
             if watch_path or dest_path or "scan_enabled" in payload:
@@ -125,11 +373,17 @@ class EchoEtcherAgent(BaseAgent):
                     await self.start_watching()
                 else:
                     await self.stop_watching()
+            
+            # Let run() pick up the new schedule immediately
+            self._wake.set()
                 
             return {"status": "success", "message": "Configuration updated"}
 
         if action == "scan":
             await self.scan_folder()
+            # A manual scan restarts the scheduled scan interval
+            self._last_scan = time.monotonic()
+            self._wake.set()
             return {"status": "success", "message": "Scan triggered"}
 
         return {"status": "error", "message": "Unknown action"}
@@ -138,71 +392,73 @@ class EchoEtcherAgent(BaseAgent):
         """
         Main loop. Runs watchdog observer + periodic scheduled scans.
         """
-        last_scan = 0
-        
-        # Ensure we have config
-        if not self.watch_path:
-            raw_watch = await self.get_memory("watch_path")
-            self.watch_path = os.path.expanduser(raw_watch) if raw_watch else None
-        if not self.dest_path:
-            raw_dest = await self.get_memory("dest_path")
-            self.dest_path = os.path.expanduser(raw_dest) if raw_dest else None
-            
-        # Load scan config
-        raw_scan_enabled = await self.get_memory("scan_enabled")
-        self.scan_enabled = str(raw_scan_enabled).lower() == 'true' if raw_scan_enabled is not None else False
-        
-        raw_scan_interval = await self.get_memory("scan_interval")
-        self.scan_interval = int(raw_scan_interval) if raw_scan_interval is not None else 120
-            
+        # Config is loaded once by load_config() and kept current by configure
+        self._resume_enrichments()
         # Initialize components if paths are set and scanning is enabled
         if self.watch_path and self.dest_path and self.scan_enabled and not self.observer:
             await self.start_watching()
-            # Initial scan on startup
-            await self.scan_folder()
-            last_scan = time.time()
+            # Initial scan on startup, in the background: the observer is already
+            # running, and a large backlog should not hold up the scheduler
+            self.start_scan()
         
-        # Periodic scan loop
+        # Periodic scan loop: sleep until the next scan is due, or until
+        # configure/scan wakes us up to re-evaluate the schedule
         while True:
-            await asyncio.sleep(10)  # Check every 10 seconds
+            timeout = None
+            if self.scan_enabled:
+                timeout = max(0, self.scan_interval - (time.monotonic() - self._last_scan))
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
             if not self.scan_enabled:
                 continue
                 
-            current_time = time.time()
-            if current_time - last_scan >= self.scan_interval:
-                if self.watch_path and self.dest_path:
+            current_time = time.monotonic()
+            if current_time - self._last_scan >= self.scan_interval:
+                if self._scan_task and not self._scan_task.done():
+                    await self.debug(lambda: "DEBUG: Previous scan still running, skipping scheduled scan")
+                elif self.watch_path and self.dest_path:
                     await self.log_to_ui(f"Running scheduled scan...")
-                    await self.scan_folder()
-                    last_scan = current_time
+                    await self.scan_folder(force=False)
+                self._last_scan = current_time
             
     async def start_watching(self):
         if self.observer:
             self.observer.stop()
             self.observer.join()
-            
-        raw_watch = await self.get_memory("watch_path")
-        self.watch_path = self._sanitize_path(os.path.expanduser(raw_watch)) if raw_watch else None
-        
-        raw_dest = await self.get_memory("dest_path")
-        self.dest_path = self._sanitize_path(os.path.expanduser(raw_dest)) if raw_dest else None
+        await self._stop_workers()
+        self._loop = asyncio.get_running_loop()
         
         if not self.watch_path or not os.path.exists(self.watch_path):
             await self.log_to_ui(f"Invalid watch path: {repr(self.watch_path)}")
             return
 
-        # Initialize managers
         try:
-            vault_path = str(Path(self.dest_path).parent)
-            folder_name = Path(self.dest_path).name
-            
-            self.processor_manager = ContentProcessorManager(self) # Pass self to give access to LLM
-            self.note_manager = NoteManager(vault_path=vault_path, notes_folder=folder_name)
+            self._ensure_managers()
             
-            event_handler = Handler(self)
-            self.observer = Observer()
-            self.observer.schedule(event_handler, self.watch_path, recursive=False)
+            if _is_network_fs(self.watch_path):
+                # Native backends (inotify, ReadDirectoryChangesW) drop or never see
+                # events on network shares; poll the folder instead
+                event_handler = Handler(self, self._loop, close_events=False)
+                self.observer = PollingObserver(timeout=5)
+                self.observer.schedule(event_handler, self.watch_path, recursive=False)
+                await self.log_to_ui("Watch path is on a network share, using polling observer")
+            elif INOTIFY_AVAILABLE:
+                loop = self._loop
+                self.observer = InotifyObserver(
+                    self.watch_path,
+                    lambda path: loop.call_soon_threadsafe(self._submit, path)
+                )
+            else:
+                event_handler = Handler(self, self._loop)
+                self.observer = Observer()
+                self.observer.schedule(event_handler, self.watch_path, recursive=False)
             self.observer.start()
             
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+            
             await self.log_to_ui(f"Started watching: {self.watch_path}")
         except Exception as e:
             await self.log_to_ui(f"Error starting observer: {e}")
@@ -213,180 +469,579 @@ class EchoEtcherAgent(BaseAgent):
             self.observer.join()
             self.observer = None
             await self.log_to_ui("Stopped watching.")
+        await self._stop_workers()
+    
+    async def _stop_workers(self):
+        """
+        Cancel the watcher worker pool and tear down its event state.
+        Afterwards no path is left claimed by the watcher: queued paths are
+        released from _inflight, cancelled workers release their own in
+        _worker's finally, and pending re-queues, dirty marks and debounce
+        times are dropped. Paths held by a running scan stay claimed until
+        that scan is done with them; _submit ignores its re-submits meanwhile.
+        """
+        # Emptied first, so nothing cancelled below can submit new work
+        workers, self._workers = self._workers, []
+        for timer in self._requeue_timers.values():
+            timer.cancel()
+        self._requeue_timers.clear()
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        while not self._work_queue.empty():
+            self._inflight.discard(self._work_queue.get_nowait())
+            self._work_queue.task_done()
+        self._dirty.clear()
+        self._debounce.clear()
+    
+    def _submit(self, path: str):
+        """
+        Queue a path for processing. Must be called on the event loop thread
+        (the observer uses loop.call_soon_threadsafe). Repeat events for a path
+        that is in flight or was queued under 2s ago are coalesced into a single
+        re-queue rather than dropped, so a rewrite mid-run is not lost.
+        A no-op while the worker pool is stopped: nothing would drain the queue.
+        """
+        if not self._workers or _should_skip(os.path.basename(path)):
+            return
+        # Any event not queued right away leaves work the scan sentinel cannot see
+        if path in self._inflight:
+            self._scan_sentinel = None
+            self._dirty.add(path)  # re-queued by _release
+            return
+        now = time.monotonic()
+        wait = 2.0 - (now - self._debounce.get(path, float("-inf")))
+        if wait > 0:
+            self._scan_sentinel = None
+            if path not in self._dirty:
+                self._dirty.add(path)
+                self._requeue_timers[path] = asyncio.get_running_loop().call_later(wait, self._requeue, path)
+            return
+        self._debounce[path] = now
+        try:
+            self._work_queue.put_nowait(path)
+        except asyncio.QueueFull:
+            self._scan_sentinel = None
+            logging.warning("EchoEtcher work queue full, dropping event for %s", path)
+            return
+        self._inflight.add(path)
+    
+    def _requeue(self, path: str):
+        """Debounce window expired: submit a coalesced path unless a run still holds it."""
+        self._requeue_timers.pop(path, None)
+        if path in self._dirty and path not in self._inflight:
+            self._dirty.discard(path)
+            self._submit(path)
+    
+    def _release(self, path: str):
+        """Release an in-flight path, re-queueing it if events arrived meanwhile."""
+        self._inflight.discard(path)
+        if path in self._dirty:
+            self._dirty.discard(path)
+            self._submit(path)
+    
+    async def _worker(self):
+        """Drain the work queue, processing one file at a time."""
+        while True:
+            path = await self._work_queue.get()
+            try:
+                if not os.path.isfile(path):
+                    # Moved or deleted since it was queued, e.g. a coalesced
+                    # re-queue of audio that its first run already archived
+                    await self.debug(lambda: f"DEBUG: Skipping vanished file: {path}")
+                elif self._is_seen(path):
+                    await self.debug(lambda: f"DEBUG: Skipping unchanged file: {path}")
+                elif not await self.process_file(Path(path)):
+                    self._scan_sentinel = None  # let the next scheduled scan retry it
+            finally:
+                self._release(path)
+                self._work_queue.task_done()
+                self._prune_debounce()
+    
+    def _is_seen(self, path: str, st: os.stat_result = None) -> bool:
+        """True if path was already processed and is unchanged since (per the manifest)."""
+        fingerprint = self._seen.get(path)
+        if fingerprint is None:
+            return False
+        if st is None:
+            try:
+                st = os.stat(path, follow_symlinks=False)
+            except OSError:
+                return False
+        if fingerprint != (st.st_ino, st.st_mtime_ns, st.st_size):
+            return False
+        self._seen.move_to_end(path)
+        return True
+
+    def _remember(self, path: str, fingerprint: tuple):
+        """Record a processed file in the manifest, evicting the least recently seen if full."""
+        self._seen[path] = fingerprint
+        self._seen.move_to_end(path)
+        while len(self._seen) > MANIFEST_MAX_ENTRIES:
+            self._seen.popitem(last=False)
+        self._schedule_manifest_save()
+
+    def _prune_debounce(self):
+        """Forget debounce entries older than a minute (checked at most once a minute)."""
+        now = time.monotonic()
+        if now - self._debounce_pruned < 60:
+            return
+        self._debounce_pruned = now
+        self._debounce = {p: t for p, t in self._debounce.items() if now - t < 60}
     
     async def cleanup(self):
         """
         Graceful shutdown: stop file watcher and clean up resources.
         """
         await self.stop_watching()
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self._manifest_save_task and not self._manifest_save_task.done():
+            self._manifest_save_task.cancel()
+            await self._save_manifest()
+        if self._pending_save_task and not self._pending_save_task.done():
+            self._pending_save_task.cancel()
+            await self._save_pending()
+        if self._config_save_task and not self._config_save_task.done():
+            self._config_save_task.cancel()
+            await self._save_config()
+        if self.processor_manager:
+            self.processor_manager.close()
         self.processor_manager = None
         self.note_manager = None
 
     async def log_to_ui(self, message: str):
         """Log to local list for UI consumption"""
-        timestamp = time.strftime("%H:%M:%S")
-        log_msg = f"[{timestamp}] {message}"
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        log_msg = f"[{self._ts_cache[1]}] {message}"
+        # deque keeps only the last 100 logs
         self.logs.append(log_msg)
-        # Keep only last 100 logs
-        if len(self.logs) > 100:
-            self.logs.pop(0)
         # Also log to standard logger
         await self.log(message)
 
-    async def scan_folder(self):
-        """Manually scans the watched folder for content."""
-        # Ensure paths are loaded from memory if not set
-        if not self.watch_path:
-            raw_watch = await self.get_memory("watch_path")
-            self.watch_path = self._sanitize_path(os.path.expanduser(raw_watch)) if raw_watch else None
-        if not self.dest_path:
-            raw_dest = await self.get_memory("dest_path")
-            self.dest_path = self._sanitize_path(os.path.expanduser(raw_dest)) if raw_dest else None
-            
+    async def _log_traceback(self, context: str, exc: Exception):
+        """
+        At DEBUG level, log the current traceback, but only the first time a given
+        (context, exception type) pair is seen; the set is reset hourly so a
+        recurring failure is still traced now and then.
+        """
+        if self.log_level != "DEBUG":
+            return
+        now = time.monotonic()
+        if now - self._traced_reset > 3600:
+            self._traced_exceptions.clear()
+            self._traced_reset = now
+        fp = (context, type(exc).__name__)
+        if fp in self._traced_exceptions:
+            await self.log_to_ui(f"DEBUG: {context}: {type(exc).__name__} (repeat, trace suppressed)")
+            return
+        self._traced_exceptions.add(fp)
+        import traceback
+        await self.log_to_ui(f"DEBUG: Traceback: {traceback.format_exc()[:500]}")
+
+    async def debug(self, msg_fn):
+        """
+        Log a DEBUG message to the UI only when log_level is DEBUG.
+        Takes a callable so the message is not formatted otherwise.
+        """
+        if self.log_level != "DEBUG":
+            return
+        await self.log_to_ui(msg_fn())
+
+    def start_scan(self) -> bool:
+        """
+        Run scan_folder as a background task so the caller is not blocked
+        for the length of the scan. Returns False if a scan is already running.
+        """
+        if self._scan_task and not self._scan_task.done():
+            return False
+        self._scan_task = asyncio.create_task(self.scan_folder())
+        self._background_tasks.add(self._scan_task)
+        self._scan_task.add_done_callback(self._background_tasks.discard)
+        # A manual scan restarts the scheduled scan interval
+        self._last_scan = time.monotonic()
+        self._wake.set()
+        return True
+
+    async def scan_folder(self, force: bool = True):
+        """
+        Scan the watched folder for new or changed content.
+        
+        Args:
+            force: If False, skip the scan when the folder's mtime is unchanged
+                since the last scan that left nothing pending (used by scheduled scans)
+        """
         if not self.watch_path:
              await self.log_to_ui(f"Cannot scan: Watch path not set")
              return
              
-        # Debug diagnostics for path issues
         watch_path_obj = Path(self.watch_path)
-        await self.log_to_ui(f"DEBUG: Checking path: {self.watch_path}")
-        await self.log_to_ui(f"DEBUG: os.path.exists = {os.path.exists(self.watch_path)}")
-        await self.log_to_ui(f"DEBUG: Path.exists() = {watch_path_obj.exists()}")
-        await self.log_to_ui(f"DEBUG: Path.is_dir() = {watch_path_obj.is_dir()}")
         
-        # Check parent directories to find where the path breaks
-        parent = watch_path_obj
-        while parent != parent.parent:
-            if parent.exists():
-                await self.log_to_ui(f"DEBUG: EXISTS: {parent}")
-                break
-            else:
-                await self.log_to_ui(f"DEBUG: MISSING: {parent}")
-            parent = parent.parent
+        # Debug diagnostics for path issues, once per watch path
+        if self.log_level == "DEBUG" and self.watch_path not in self._diagnosed_paths:
+            await self.debug(lambda: f"DEBUG: Checking path: {self.watch_path}")
+            await self.debug(lambda: f"DEBUG: os.path.exists = {os.path.exists(self.watch_path)}")
+            await self.debug(lambda: f"DEBUG: Path.exists() = {watch_path_obj.exists()}")
+            await self.debug(lambda: f"DEBUG: Path.is_dir() = {watch_path_obj.is_dir()}")
+            
+            # Check parent directories to find where the path breaks
+            parent = watch_path_obj
+            while parent != parent.parent:
+                if parent.exists():
+                    await self.debug(lambda: f"DEBUG: EXISTS: {parent}")
+                    break
+                else:
+                    await self.debug(lambda: f"DEBUG: MISSING: {parent}")
+                parent = parent.parent
+            self._diagnosed_paths.add(self.watch_path)
              
         if not watch_path_obj.is_dir():
              await self.log_to_ui(f"Cannot scan: Watch path invalid: {repr(self.watch_path)}")
              return
 
+        # Adding, removing or renaming an entry bumps the directory mtime; in-place
+        # rewrites do not. Those only reach us reliably as inotify close-write
+        # events, so the shortcut is limited to InotifyObserver (other observers
+        # may never report a rewrite, and _submit clears the sentinel whenever it
+        # cannot queue an event).
+        dir_mtime = os.stat(self.watch_path).st_mtime_ns
+        if not isinstance(self.observer, InotifyObserver):
+            self._scan_sentinel = None
+        if not force and self._scan_sentinel == (self.watch_path, dir_mtime):
+            await self.debug(lambda: "DEBUG: Watch folder unchanged since last scan, skipping")
+            return
+
         await self.log_to_ui(f"Scanning folder: {self.watch_path}")
-        await EventBus.publish("echo_etcher:scan_started", {"sender": self.name, "path": self.watch_path})
         
-        # We need to initialize components if not running
-        if not self.processor_manager:
-             self.processor_manager = ContentProcessorManager(self)
-             
-             if self.dest_path:
-                 vault_path = str(Path(self.dest_path).parent)
-                 folder_name = Path(self.dest_path).name
-                 self.note_manager = NoteManager(vault_path=vault_path, notes_folder=folder_name)
-             else:
-                 self.note_manager = NoteManager()
+        self._ensure_managers()
 
+        # Per-file events are collected and published once, as a single scan_batch event
+        events: List[Dict[str, Any]] = []
+        tasks = []
         try:
-            count = 0
-            for entry in os.scandir(self.watch_path):
-                if entry.is_file() and not entry.name.startswith('.'):
-                    await self.process_file(Path(entry.path))
-                    count += 1
-            await self.log_to_ui(f"Scan complete. Processed {count} items.")
+            sem = asyncio.Semaphore(self.scan_concurrency)
+            supported = self.processor_manager.supported_extensions
+            unsupported = 0
+            clean = True  # nothing left for a later scan to retry
+            # Closing the iterator explicitly releases the directory handle even if we bail out early
+            with os.scandir(self.watch_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if _should_skip(name) or not entry.is_file(follow_symlinks=False):
+                        continue
+                    if os.path.splitext(name)[1].lower() not in supported:
+                        unsupported += 1
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_size == 0 or entry.path in self._inflight:
+                        clean = False
+                        continue
+                    if self._is_seen(entry.path, st):
+                        continue
+                    self._inflight.add(entry.path)
+                    tasks.append(asyncio.create_task(self._guarded_process(sem, entry.path, events)))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if clean and all(r is True for r in results):
+                self._scan_sentinel = (self.watch_path, dir_mtime)
+            else:
+                self._scan_sentinel = None
+            await self.log_to_ui(f"Scan complete. Processed {len(tasks)} items, skipped {unsupported} unsupported.")
         except Exception as e:
+            self._scan_sentinel = None
             await self.log_to_ui(f"Error during scan: {e}")
+        finally:
+            await EventBus.publish("echo_etcher:scan_batch", {
+                "sender": self.name,
+                "path": self.watch_path,
+                "count": len(tasks),
+                "events": events
+            })
+
+    async def _guarded_process(self, sem: asyncio.Semaphore, path: str, events: List[Dict[str, Any]]):
+        try:
+            async with sem:
+                return await self.process_file(path, events=events)
+        finally:
+            self._release(path)
 
-    async def process_file(self, file_path: Path):
+    async def _publish(self, topic: str, payload: Dict[str, Any], events: List[Dict[str, Any]] = None):
+        """Publish an event, or append it to a batch when one is being collected."""
+        if events is None:
+            await EventBus.publish(topic, payload)
+        else:
+            events.append({"event": topic, **payload})
+
+    async def process_file(self, file_path: Union[str, Path], events: List[Dict[str, Any]] = None) -> bool:
+        """
+        Extract a file's content and write its note.
+        
+        Args:
+            file_path: File (or folder) to process
+            events: If given, per-file events are appended here instead of published
+        
+        Returns:
+            False if processing failed and the file should be retried later
+        """
+        file_path = Path(file_path)
         await self.log_to_ui(f"Processing detected file: {file_path.name}")
-        await EventBus.publish("echo_etcher:file_detected", {"sender": self.name, "file": file_path.name})
+        await self._publish("echo_etcher:file_detected", {"sender": self.name, "file": file_path.name}, events)
         try:
-            if not self.processor_manager:
-                await self.log_to_ui("Processor manager not initialized")
-                return
+            if not self.processor_manager or not self.note_manager:
+                await self.log_to_ui("Processor or note manager not initialized (is dest_path set?)")
+                return False
 
-            if not self.processor_manager.can_process(file_path):
-                await self.log_to_ui(f"Skipping unsupported file: {file_path.name}")
-                return
+            # Fingerprint before processing: audio sources are moved into the vault
+            st = os.stat(file_path, follow_symlinks=False)
+            fingerprint = (st.st_ino, st.st_mtime_ns, st.st_size)
 
-            # Get processor
+            # One suffix lookup both checks support and picks the processor
             processor = self.processor_manager.get_processor(file_path)
-            content = processor.extract_content(file_path)
+            if processor is None:
+                await self.log_to_ui(f"Skipping unsupported file: {file_path.name}")
+                return True
+            # Extraction (Whisper, OCR, file reads) is blocking; keep it off the event loop
+            content = await asyncio.to_thread(processor.extract_content, file_path)
             
             # DEBUG: Log raw extracted content
             raw_text_len = len(content.get('text', ''))
-            await self.log_to_ui(f"DEBUG: Raw extracted text length: {raw_text_len} chars")
+            await self.debug(lambda: f"DEBUG: Raw extracted text length: {raw_text_len} chars")
             if raw_text_len > 0:
-                preview = content.get('text', '')[:200]
-                await self.log_to_ui(f"DEBUG: Text preview: {preview}...")
+                await self.debug(lambda: f"DEBUG: Text preview: {content.get('text', '')[:200]}...")
             else:
-                await self.log_to_ui(f"DEBUG: WARNING - No text extracted from file!")
-            
-            # Use LLM to format note (using the agent's LLM client)
-            processed_content = await self.processor_manager.enrich_with_llm(content, file_path)
-            
-            # DEBUG: Log enriched content
-            await self.log_to_ui(f"DEBUG: After LLM - title: {processed_content.get('title')}")
-            await self.log_to_ui(f"DEBUG: After LLM - tags: {processed_content.get('tags')}")
-            await self.log_to_ui(f"DEBUG: After LLM - summary length: {len(processed_content.get('ai_summary', ''))}")
-            await self.log_to_ui(f"DEBUG: After LLM - formatted_content length: {len(processed_content.get('formatted_content', ''))}")
+                await self.debug(lambda: f"DEBUG: WARNING - No text extracted from file!")
             
             # Extract recording date from metadata if available
             recording_date = None
-            metadata = processed_content.get('metadata', {})
+            metadata = content.get('metadata', {})
             if 'recording_date' in metadata:
                 recording_date = metadata['recording_date']
                 await self.log_to_ui(f"Found recording date: {recording_date}")
             else:
                 await self.log_to_ui("No recording date found in metadata, will use processing date")
             
-            # Create note
-            result = self.note_manager.create_note(processed_content, file_path, recording_date=recording_date)
+            # Create a provisional note from the raw content right away;
+            # LLM formatting runs in the background and rewrites it.
+            # With no extracted text there is nothing to format, so the note is final.
+            needs_llm = raw_text_len > 0
+            provisional = dict(content, title=file_path.stem, tags=['#pending'] if needs_llm else [],
+                               ai_summary='', formatted_content='')
+            result = self.note_manager.create_note(provisional, file_path, recording_date=recording_date)
             await self.log_to_ui(f"Note created: {result.get('note_path')}")
-            await EventBus.publish("echo_etcher:note_created", {
+            await self._publish("echo_etcher:note_created", {
                 "sender": self.name, 
                 "file": file_path.name, 
                 "note": result.get('note_path')
-            })
+            }, events)
+            
+            key = str(file_path)
+            if needs_llm:
+                # Persist before remembering the file, so an interrupted
+                # enrichment is resumed rather than lost on restart
+                self._pending[key] = {
+                    "content": {"text": content.get("text", ""), "source_type": content.get("source_type", "unknown")},
+                    "note": result,
+                }
+                self._schedule_pending_save()
+            self._remember(key, fingerprint)
+            
+            if needs_llm:
+                self._start_enrichment(key)
+            return True
             
         except Exception as e:
-            import traceback
             await self.log_to_ui(f"Error processing {file_path.name}: {e}")
-            await self.log_to_ui(f"DEBUG: Traceback: {traceback.format_exc()[:500]}")
+            await self._log_traceback("process", e)
+            return False
+
+    def _start_enrichment(self, key: str):
+        """Run the pending enrichment for a source path in the background, unless already running."""
+        if key in self._active_enrichments:
+            return
+        entry = self._pending[key]
+        self._active_enrichments.add(key)
+        task = asyncio.create_task(self._enrich_and_update(dict(entry["content"]), Path(key), entry["note"]))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _resume_enrichments(self):
+        """Restart enrichments that were still pending when the agent last shut down."""
+        if not self._pending or not self.processor_manager or not self.note_manager:
+            return
+        logging.info("Resuming %d pending note enrichment(s)", len(self._pending))
+        for key in list(self._pending):
+            self._start_enrichment(key)
+
+    async def _enrich_and_update(self, content: Dict, file_path: Path, note_info: Dict):
+        """Format a processed file with the LLM and rewrite its provisional note."""
+        try:
+            async with self._enrich_sem:
+                # Use LLM to format note (using the agent's LLM client)
+                processed_content = await self.processor_manager.enrich_with_llm(content, file_path)
+            
+            # DEBUG: Log enriched content
+            await self.debug(lambda: (
+                f"DEBUG: After LLM - title: {processed_content.get('title')}, "
+                f"tags: {processed_content.get('tags')}, "
+                f"summary length: {len(processed_content.get('ai_summary', ''))}, "
+                f"formatted_content length: {len(processed_content.get('formatted_content', ''))}"
+            ))
+            
+            result = self.note_manager.update_note(note_info, processed_content)
+            await self.log_to_ui(f"Note updated: {result.get('note_path')}")
+            await EventBus.publish("echo_etcher:note_updated", {
+                "sender": self.name, 
+                "file": file_path.name, 
+                "note": result.get('note_path')
+            })
+        except asyncio.CancelledError:
+            # Shutting down: keep the pending entry for the next start
+            raise
+        except Exception as e:
+            await self.log_to_ui(f"Error enriching {file_path.name}: {e}")
+            await self._log_traceback("enrich", e)
+        finally:
+            self._active_enrichments.discard(str(file_path))
+        # Finished, or failed in a way a retry would repeat
+        key = str(file_path)
+        entry = self._pending.get(key)
+        if entry is not None and entry["note"] is note_info:
+            del self._pending[key]
+            self._schedule_pending_save()
+        elif entry is not None:
+            self._start_enrichment(key)  # reprocessed while this one ran
+
+    def _schedule_manifest_save(self):
+        """Coalesce manifest writes into one save_memory call every few seconds."""
+        self._manifest_dirty = True
+        if self._manifest_save_task and not self._manifest_save_task.done():
+            return
+        self._manifest_save_task = asyncio.create_task(self._save_manifest(delay=5))
+
+    async def _save_manifest(self, delay: float = 0):
+        if delay:
+            await asyncio.sleep(delay)
+        while True:
+            self._manifest_dirty = False
+            await self.save_memory("scanned_manifest", json.dumps(self._seen))
+            if not self._manifest_dirty:
+                break
+
+    def _schedule_pending_save(self):
+        """Coalesce pending-enrichment writes like the manifest's."""
+        self._pending_dirty = True
+        if self._pending_save_task and not self._pending_save_task.done():
+            return
+        self._pending_save_task = asyncio.create_task(self._save_pending(delay=1))
+
+    async def _save_pending(self, delay: float = 0):
+        if delay:
+            await asyncio.sleep(delay)
+        while True:
+            self._pending_dirty = False
+            await self.save_memory("pending_enrichments", json.dumps(self._pending))
+            if not self._pending_dirty:
+                break
 
 class Handler(FileSystemEventHandler):
     """
     File system event handler for EchoEtcher file watching.
     Dispatches file creation events to the agent for processing.
     """
-    def __init__(self, agent: 'EchoEtcherAgent'):
+    def __init__(self, agent: 'EchoEtcherAgent', loop: asyncio.AbstractEventLoop, close_events: bool = None):
         """
         Initialize the handler with a reference to the agent.
         
         Args:
             agent: The EchoEtcherAgent instance to dispatch events to
+            loop: The agent's running event loop, captured once in start_watching
+            close_events: Override close-event handling; must be False for
+                observers that never emit them (e.g. PollingObserver)
         """
         self.agent = agent
+        self.loop = loop
+        self.submit = agent._submit
+        if close_events is not None:
+            self.close_events = close_events
+
+    # On Linux watchdog reports IN_CLOSE_WRITE as on_closed, which fires once
+    # the writer is done, so creation events are ignored there.
+    close_events = sys.platform.startswith('linux') and hasattr(FileSystemEventHandler, 'on_closed')
 
     def on_created(self, event) -> None:
         """
         Handle file creation events from the file system watcher.
+        Runs on the observer thread, so the path is handed to the agent's
+        event loop rather than processed here.
         
         Args:
             event: File system event from watchdog
         """
-        if not event.is_directory:
-            import asyncio
-            # Build a safe way to run async from sync callback
-            # For this MVP, we might just fire and forget or use a loop helper
-            # Correct way in BaseAgent context isn't strictly defined for sync callbacks
-            # We will try to get the running loop
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(self.agent.process_file(Path(event.src_path)))
-            except RuntimeError:
-                # No running loop, try to get event loop (for compatibility)
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        loop.create_task(self.agent.process_file(Path(event.src_path)))
-                except Exception as e:
-                    print(f"Error dispatching file event: {e}")
-            except Exception as e:
-                print(f"Error dispatching file event: {e}")
+        if event.is_directory:
+            return
+        # With close events a file still being written is submitted by on_closed.
+        # One moved in from outside the watched tree arrives as a creation with
+        # no close to follow, so it is submitted here once nobody is writing it.
+        if self.close_events and _has_writer(event.src_path):
+            return
+        self.loop.call_soon_threadsafe(self.submit, event.src_path)
+
+    def on_closed(self, event) -> None:
+        """Handle a file closed after writing (Linux only)."""
+        if event.is_directory:
+            return
+        self.loop.call_soon_threadsafe(self.submit, event.src_path)
+
+    def on_moved(self, event) -> None:
+        """Handle a file renamed into place within the watched folder."""
+        if event.is_directory:
+            return
+        self.loop.call_soon_threadsafe(self.submit, event.dest_path)
+
+class InotifyObserver:
+    """
+    Linux-only watcher built directly on inotify.
+    Only subscribes to IN_CLOSE_WRITE and IN_MOVED_TO, i.e. files that are
+    fully written or moved into the folder, so partially written files never
+    reach the agent. Exposes the same start/stop/join interface as watchdog's Observer.
+    """
+    def __init__(self, path: str, callback):
+        """
+        Args:
+            path: Directory to watch (non-recursive)
+            callback: Called from the watcher thread with the full path of each ready file
+        """
+        self.path = path
+        self.callback = callback
+        self._inotify = None
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        self._inotify = INotify()
+        self._inotify.add_watch(self.path, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+        self._thread = threading.Thread(target=self._run, name="echo-etcher-inotify", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            # Wake up at least once a second to notice stop()
+            for event in self._inotify.read(timeout=1000):
+                if not event.name or event.mask & inotify_flags.ISDIR:
+                    continue
+                self.callback(os.path.join(self.path, event.name))
+
+    def stop(self) -> None:
+        self._stop_event.set()
 
+    def join(self) -> None:
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
@@ -1,7 +1,9 @@
 from pathlib import Path
 from typing import Dict, Optional
-from datetime import datetime
+from datetime import datetime, MINYEAR
 import logging
+import re
+import threading
 from .base_processor import BaseContentProcessor
 from ..transcriber import WhisperTranscriber
 
@@ -12,10 +14,46 @@ try:
 except ImportError:
     MUTAGEN_AVAILABLE = False
 
+# Date tag keys in lookup order, per tag family:
+# ID3 recording/release/tagging time, MP4 (QuickTime) dates, Vorbis comments
+_ID3_DATE_KEYS = ('TDRC', 'TDRL', 'TDTG')
+_MP4_DATE_KEYS = ('©day', '©rec', 'creation_date', 'recording_date')
+_VORBIS_DATE_KEYS = ('DATE', 'RECORDINGDATE', 'RECORDING_DATE')
+_DATE_TAG_KEYS = _ID3_DATE_KEYS + _MP4_DATE_KEYS + _VORBIS_DATE_KEYS
+
+# The tag family is fixed by the container, so only its keys need probing
+_DATE_TAG_KEYS_BY_EXT = {
+    '.mp3': _ID3_DATE_KEYS,
+    '.wav': _ID3_DATE_KEYS,
+    '.aac': _ID3_DATE_KEYS,
+    '.m4a': _MP4_DATE_KEYS,
+    '.flac': _VORBIS_DATE_KEYS,
+    '.ogg': _VORBIS_DATE_KEYS,
+}
+
+# YYYY[-MM[-DD[(T| )HH:MM[:SS]]]] at the start of a tag value
+_DATE_RE = re.compile(r'(\d{4})(?:[-/](\d{2})(?:[-/](\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2}))?)?)?)?')
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parse a metadata date string without exceptions as control flow on the common path."""
+    m = _DATE_RE.match(value.strip())
+    if not m:
+        return None
+    year, month, day, hour, minute, second = (int(g) if g else None for g in m.groups())
+    if year < MINYEAR:  # e.g. a "0000" placeholder tag
+        return None
+    try:
+        return datetime(year, month or 1, day or 1, hour or 0, minute or 0, second or 0)
+    except ValueError:  # out-of-range field, e.g. month 13: keep just the year
+        return datetime(year, 1, 1)
+
 class AudioProcessor(BaseContentProcessor):
     def __init__(self):
         self.transcriber = None
         self._transcriber_loaded = False
+        # extract_content runs in worker threads; one Whisper model must not
+        # be loaded twice or run concurrently
+        self._transcribe_lock = threading.Lock()
         super().__init__()
     
     def get_supported_extensions(self) -> list:
@@ -24,7 +62,8 @@ class AudioProcessor(BaseContentProcessor):
     def _extract_recording_date(self, file_path: Path) -> Optional[datetime]:
         """
         Extract recording date from audio file metadata.
-        Tries multiple metadata fields depending on file format.
+        Tries the date fields of the tag family used by the file's container
+        (ID3, MP4 or Vorbis), or all of them for unknown extensions.
         
         Returns:
             datetime object if recording date found, None otherwise
@@ -35,79 +74,26 @@ class AudioProcessor(BaseContentProcessor):
         
         try:
             audio_file = MutagenFile(str(file_path))
-            if audio_file is None:
+            if audio_file is None or audio_file.tags is None:
                 return None
             
-            recording_date = None
-            
-            # Try different metadata fields depending on format
-            # MP3 (ID3 tags)
-            if hasattr(audio_file, 'get'):
-                # TDRC = Recording time (ID3v2.4)
-                # TDRL = Release time (ID3v2.4)
-                # TDTG = Tagging time (ID3v2.4)
-                # For older ID3v2.3, might be TYER + TDAT
-                for tag in ['TDRC', 'TDRL', 'TDTG']:
-                    if tag in audio_file:
-                        try:
-                            date_str = str(audio_file[tag][0])
-                            # Try parsing various date formats
-                            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y']:
-                                try:
-                                    recording_date = datetime.strptime(date_str[:len(fmt)], fmt)
-                                    logging.info(f"Found recording date from {tag}: {recording_date}")
-                                    break
-                                except ValueError:
-                                    continue
-                            if recording_date:
-                                break
-                        except (ValueError, IndexError, AttributeError):
-                            continue
-            
-            # M4A/MP4 (QuickTime metadata)
-            if not recording_date and hasattr(audio_file, 'tags'):
-                # Try creation date or recording date
-                for key in ['©day', '©rec', 'creation_date', 'recording_date']:
-                    if key in audio_file.tags:
-                        try:
-                            date_str = str(audio_file.tags[key][0])
-                            # M4A dates are often in ISO format
-                            for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y']:
-                                try:
-                                    recording_date = datetime.strptime(date_str[:len(fmt)], fmt)
-                                    logging.info(f"Found recording date from {key}: {recording_date}")
-                                    break
-                                except ValueError:
-                                    continue
-                            if recording_date:
-                                break
-                        except (ValueError, IndexError, AttributeError):
-                            continue
-            
-            # FLAC/Vorbis comments
-            if not recording_date and hasattr(audio_file, 'tags'):
-                for key in ['DATE', 'RECORDINGDATE', 'RECORDING_DATE']:
-                    if key in audio_file.tags:
-                        try:
-                            date_str = str(audio_file.tags[key][0])
-                            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y']:
-                                try:
-                                    recording_date = datetime.strptime(date_str[:len(fmt)], fmt)
-                                    logging.info(f"Found recording date from {key}: {recording_date}")
-                                    break
-                                except ValueError:
-                                    continue
-                            if recording_date:
-                                break
-                        except (ValueError, IndexError, AttributeError):
-                            continue
-            
-            return recording_date
+            tags = audio_file.tags
+            for key in _DATE_TAG_KEYS_BY_EXT.get(file_path.suffix.lower(), _DATE_TAG_KEYS):
+                if key not in tags:
+                    continue
+                try:
+                    recording_date = _parse_date(str(tags[key][0]))
+                except (IndexError, KeyError, TypeError):
+                    continue
+                if recording_date:
+                    logging.info("Found recording date from %s: %s", key, recording_date)
+                    return recording_date
+            return None
             
         except Exception as e:
-            logging.debug(f"Error extracting recording date from {file_path}: {e}")
+            logging.debug("Error extracting recording date from %s: %s", file_path, e)
             return None
-    
+
     def _ensure_transcriber_loaded(self):
         if not self._transcriber_loaded:
             logging.info("Loading Whisper transcriber for audio processing...")
@@ -115,17 +101,20 @@ class AudioProcessor(BaseContentProcessor):
             self._transcriber_loaded = True
     
     def extract_content(self, file_path: Path) -> Dict:
-        self._ensure_transcriber_loaded()
-        
-        logging.info(f"Transcribing audio file: {file_path}")
-        transcription_data = self.transcriber.transcribe(file_path)
+        with self._transcribe_lock:
+            self._ensure_transcriber_loaded()
+            
+            logging.info("Transcribing audio file: %s", file_path)
+            transcription_data = self.transcriber.transcribe(file_path)
         
         # Extract recording date from audio metadata
         recording_date = self._extract_recording_date(file_path)
         
+        # Only the segment count is kept: the segments are large for long
+        # recordings and nothing downstream reads them
         metadata = {
             'language': transcription_data.get('language'),
-            'segments': transcription_data.get('segments', []),
+            'segment_count': len(transcription_data.get('segments', [])),
             'audio_file': str(file_path),
         }
         
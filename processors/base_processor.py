@@ -4,7 +4,7 @@ from typing import Dict
 
 class BaseContentProcessor(ABC):
     def __init__(self):
-        self.supported_extensions = self.get_supported_extensions()
+        self.supported_extensions = frozenset(self.get_supported_extensions())
     
     @abstractmethod
     def get_supported_extensions(self) -> list:
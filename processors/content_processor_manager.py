@@ -32,6 +32,13 @@ class ContentProcessorManager:
         for p in [audio, text, image]:
             for ext in p.get_supported_extensions():
                 self._extension_map[ext.lower()] = p
+        
+        # Lowercase file extensions that have a processor, for cheap pre-filtering
+        self.supported_extensions = frozenset(self._extension_map)
+
+    def close(self):
+        """Release resources held by the processors (pooled OCR engines)."""
+        ImageProcessor.close_engines()
 
     def get_processor(self, file_path: Path) -> Optional[BaseContentProcessor]:
         if file_path.is_dir():
@@ -205,13 +212,15 @@ Respond in JSON format:
 
         text = extracted_content.get('text', '')
         source_type = extracted_content.get('source_type', 'unknown')
+        # Resolved once; not every agent exposes a UI log
+        log_to_ui = getattr(self.agent, "log_to_ui", None)
         
         # Retry loop with validation
         for attempt in range(1, self.max_formatting_retries + 1):
             try:
                 await self.agent.log(f"Formatting attempt {attempt}/{self.max_formatting_retries}")
-                if hasattr(self.agent, "log_to_ui"):
-                    await self.agent.log_to_ui(f"Formatting attempt {attempt}/{self.max_formatting_retries}...")
+                if log_to_ui:
+                    await log_to_ui(f"Formatting attempt {attempt}/{self.max_formatting_retries}...")
                 
                 # Format with LLM
                 response = await self._format_with_llm(text, source_type, file_path)
@@ -224,8 +233,8 @@ Respond in JSON format:
                 if is_valid:
                     # Validation passed - use this result
                     await self.agent.log(f"Formatting validation passed: {reason}")
-                    if hasattr(self.agent, "log_to_ui"):
-                        await self.agent.log_to_ui(f"Formatting validated successfully")
+                    if log_to_ui:
+                        await log_to_ui(f"Formatting validated successfully")
                     
                     extracted_content.update({
                         'title': response.get('title') or file_path.stem,
@@ -237,14 +246,14 @@ Respond in JSON format:
                 else:
                     # Validation failed - log and retry
                     await self.agent.log(f"Formatting validation failed (attempt {attempt}): {reason}")
-                    if hasattr(self.agent, "log_to_ui"):
-                        await self.agent.log_to_ui(f"Validation failed: {reason}. Retrying...")
+                    if log_to_ui:
+                        await log_to_ui(f"Validation failed: {reason}. Retrying...")
                     
                     # If this was the last attempt, use it anyway but log warning
                     if attempt == self.max_formatting_retries:
                         await self.agent.log(f"Max retries reached. Using formatted content despite validation failure.")
-                        if hasattr(self.agent, "log_to_ui"):
-                            await self.agent.log_to_ui(f"Max retries reached. Using formatted content.")
+                        if log_to_ui:
+                            await log_to_ui(f"Max retries reached. Using formatted content.")
                         extracted_content.update({
                             'title': response.get('title') or file_path.stem,
                             'tags': response.get('tags') or [],
@@ -258,14 +267,14 @@ Respond in JSON format:
             except Exception as e:
                 error_msg = f"LLM formatting failed on attempt {attempt}: {e}"
                 await self.agent.log(error_msg)
-                if hasattr(self.agent, "log_to_ui"):
-                    await self.agent.log_to_ui(error_msg)
+                if log_to_ui:
+                    await log_to_ui(error_msg)
                 
                 # If this was the last attempt, fall back to raw text
                 if attempt == self.max_formatting_retries:
                     await self.agent.log("All formatting attempts failed. Using raw text as fallback.")
-                    if hasattr(self.agent, "log_to_ui"):
-                        await self.agent.log_to_ui("All formatting attempts failed. Using raw text.")
+                    if log_to_ui:
+                        await log_to_ui("All formatting attempts failed. Using raw text.")
                     extracted_content.update({
                         'title': file_path.stem,
                         'tags': ['#unprocessed'],
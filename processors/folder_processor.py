@@ -1,6 +1,9 @@
+import os
+import functools
 from pathlib import Path
 from typing import Dict
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from .base_processor import BaseContentProcessor
 from .audio_processor import AudioProcessor
 from .text_processor import TextProcessor
@@ -9,11 +12,21 @@ from .image_processor import ImageProcessor
 class FolderProcessor(BaseContentProcessor):
     def __init__(self, content_processor_manager=None):
         self.content_processor_manager = content_processor_manager
-        self.audio_processor = AudioProcessor()
-        self.text_processor = TextProcessor()
-        self.image_processor = ImageProcessor()
         super().__init__()
     
+    @functools.cached_property
+    def _ext_map(self) -> Dict[str, BaseContentProcessor]:
+        """
+        Fallback suffix -> processor map, only built when used without a manager.
+        The manager's own processors are reused otherwise, so a second Whisper
+        model is never loaded.
+        """
+        return {
+            ext: p
+            for p in (AudioProcessor(), TextProcessor(), ImageProcessor())
+            for ext in p.supported_extensions
+        }
+    
     def get_supported_extensions(self) -> list:
         return []
     
@@ -22,24 +35,35 @@ class FolderProcessor(BaseContentProcessor):
     
     def extract_content(self, folder_path: Path) -> Dict:
         # Simplified implementation for MVP
-        files = sorted([f for f in folder_path.iterdir() if f.is_file()])
+        # scandir reuses the d_type from the directory listing, so no stat per entry
+        with os.scandir(folder_path) as it:
+            files = sorted(Path(e.path) for e in it if e.is_file(follow_symlinks=False))
         combined_text = []
         attachments = []
         
+        jobs = []
         for file_path in files:
             if file_path.name.startswith('.'): continue
             
-            processor = None
             if self.content_processor_manager:
                 processor = self.content_processor_manager.get_processor(file_path)
-            
-            if not processor:
-                if file_path.suffix.lower() in self.audio_processor.get_supported_extensions(): processor = self.audio_processor
-                elif file_path.suffix.lower() in self.text_processor.get_supported_extensions(): processor = self.text_processor
-                elif file_path.suffix.lower() in self.image_processor.get_supported_extensions(): processor = self.image_processor
-            
+            else:
+                processor = self._ext_map.get(file_path.suffix.lower())
+            jobs.append((file_path, processor))
+        
+        # OCR and file reads release the GIL, so files are extracted in parallel;
+        # AudioProcessor serializes Whisper itself. map() keeps the sorted order.
+        extractable = [(f, p) for f, p in jobs if p]
+        contents = {}
+        if extractable:
+            workers = min(len(extractable), os.cpu_count() or 1, 8)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(lambda job: job[1].extract_content(job[0]), extractable)
+                contents = dict(zip((f for f, _ in extractable), results))
+        
+        for file_path, processor in jobs:
             if processor:
-                content = processor.extract_content(file_path)
+                content = contents[file_path]
                 text = content.get('text', '').strip()
                 if text:
                     combined_text.append(f"\n\n## File: {file_path.name}\n{text}")
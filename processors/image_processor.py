@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Dict
 import logging
+import os
+import threading
 from .base_processor import BaseContentProcessor
 
 try:
@@ -15,13 +17,86 @@ try:
 except ImportError:
     TESSERACT_AVAILABLE = False
 
+# Optional: tesserocr keeps Tesseract engines (and their language data) loaded
+# in-process instead of spawning the tesseract binary for every image
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Longest side fed to OCR; beyond this tesseract just spends time on extra pixels
+OCR_MAX_DIMENSION = 2000
+
+# Engines in the tesserocr pool, sized like FolderProcessor's thread pool
+TESS_MAX_ENGINES = min(os.cpu_count() or 1, 8)
+
 class ImageProcessor(BaseContentProcessor):
+    # Pooled engines: PyTessBaseAPI is not thread-safe, so each concurrent
+    # OCR call borrows its own; the lock only guards the pool bookkeeping
+    _tess_idle: list = []
+    _tess_engines: list = []
+    _tess_lock = threading.Lock()
+    _tess_slots = threading.BoundedSemaphore(TESS_MAX_ENGINES)
+    _tess_failed = False
+
     def get_supported_extensions(self) -> list:
         return ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp', '.heic', '.heif']
     
+    @classmethod
+    def _acquire_engine(cls):
+        """Borrow an idle engine, creating one if none is free; None if tesserocr cannot start."""
+        with cls._tess_lock:
+            if cls._tess_idle:
+                return cls._tess_idle.pop()
+            if cls._tess_failed:
+                return None
+        try:
+            # Loads the language data; done outside the lock
+            api = tesserocr.PyTessBaseAPI()
+        except Exception as e:
+            # e.g. tessdata not found; fall back to pytesseract for good
+            logging.warning("tesserocr unavailable, falling back to pytesseract: %s", e)
+            cls._tess_failed = True
+            return None
+        with cls._tess_lock:
+            cls._tess_engines.append(api)
+        return api
+
+    @classmethod
+    def _release_engine(cls, api) -> None:
+        with cls._tess_lock:
+            if api in cls._tess_engines:
+                cls._tess_idle.append(api)
+                return
+        api.End()  # pool was closed while this engine was busy
+
+    @classmethod
+    def close_engines(cls) -> None:
+        """End the pooled Tesseract engines; engines still busy are ended when released."""
+        with cls._tess_lock:
+            idle, cls._tess_idle, cls._tess_engines = cls._tess_idle, [], []
+        for api in idle:
+            api.End()
+
+    def _ocr(self, img) -> str:
+        if TESSEROCR_AVAILABLE and not ImageProcessor._tess_failed:
+            with ImageProcessor._tess_slots:
+                api = self._acquire_engine()
+                if api is not None:
+                    try:
+                        api.SetImage(img)
+                        return api.GetUTF8Text()
+                    finally:
+                        self._release_engine(api)
+        if not TESSERACT_AVAILABLE:
+            raise RuntimeError("No OCR backend available")
+        return pytesseract.image_to_string(img)
+    
     def extract_content(self, file_path: Path) -> Dict:
         text = ""
-        metadata = {'image_file': str(file_path), 'ocr_available': PIL_AVAILABLE and TESSERACT_AVAILABLE}
+        ocr_available = TESSERACT_AVAILABLE or TESSEROCR_AVAILABLE
+        metadata = {'image_file': str(file_path), 'ocr_available': PIL_AVAILABLE and ocr_available}
         
         if PIL_AVAILABLE:
             try:
@@ -30,11 +105,18 @@ class ImageProcessor(BaseContentProcessor):
                     metadata['height'] = img.height
                     metadata['format'] = img.format
                     
-                    if TESSERACT_AVAILABLE:
+                    if ocr_available:
                         try:
-                            if img.mode != 'RGB':
-                                img = img.convert('RGB')
-                            text = pytesseract.image_to_string(img).strip()
+                            # JPEG can decode straight to a reduced, grayscale image
+                            img.draft('L', (OCR_MAX_DIMENSION, OCR_MAX_DIMENSION))
+                            # Tesseract binarizes internally; grayscale is all it needs
+                            if img.mode != 'L':
+                                img = img.convert('L')
+                            if max(img.size) > OCR_MAX_DIMENSION:
+                                img.thumbnail((OCR_MAX_DIMENSION, OCR_MAX_DIMENSION), Image.LANCZOS)
+                            if img.width != metadata['width']:
+                                metadata['ocr_scale'] = round(img.width / metadata['width'], 3)
+                            text = self._ocr(img).strip()
                             metadata['ocr_success'] = True
                         except Exception as e:
                             metadata['ocr_success'] = False
@@ -6,6 +6,22 @@ from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 
+# Characters not allowed in note/attachment filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+def _safe_title(title: str) -> str:
+    return _UNSAFE_FILENAME_RE.sub('', title).strip().replace(' ', '_')
+
+def _write_atomic(path: Path, text: str) -> None:
+    """
+    Write text to a sibling temp file and os.replace it into place, so a vault
+    watcher (e.g. Obsidian) never sees a half-written note.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
 class NoteManager:
     """
     Manages creation of notes in the Obsidian vault.
@@ -30,7 +46,7 @@ class NoteManager:
             audio_folder.mkdir(parents=True, exist_ok=True)
             attachments_folder.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            logging.error(f"Error creating directories at {notes_folder}: {e}")
+            logging.error("Error creating directories at %s: %s", notes_folder, e)
             # Fallback to tmp if permission error? 
             # For now just log and let it fail or it might crash
         
@@ -52,19 +68,12 @@ class NoteManager:
         title = processed_content.get('title', 'Untitled Note')
         
         # Use recording date if available, otherwise use current date
-        if recording_date:
-            date_str = recording_date.strftime("%Y-%m-%d")
-            time_str = recording_date.strftime("%H-%M")
-            logging.info(f"Using recording date for note: {date_str} {time_str}")
-        else:
-            now = datetime.now()
-            date_str = now.strftime("%Y-%m-%d")
-            time_str = now.strftime("%H-%M")
-            logging.info(f"Using current date for note: {date_str} {time_str}")
+        # Format once; the date folder name is the leading YYYY-MM-DD
+        date_time = (recording_date or datetime.now()).strftime("%Y-%m-%d_%H-%M")
+        date_str = date_time[:10]
+        logging.info("Using %s date for note: %s", 'recording' if recording_date else 'current', date_time)
         
-        date_time = f"{date_str}_{time_str}"
-        
-        safe_title = re.sub(r'[<>:"/\\|?*]', '', title).strip().replace(' ', '_')
+        safe_title = _safe_title(title)
         note_filename = f"{date_time}_{safe_title}.md"
         note_path = notes_folder / note_filename
         
@@ -84,9 +93,44 @@ class NoteManager:
             # Or just leave them.
             pass
 
-        # Build Content
+        note_content = self._build_content(processed_content, attachment_path, vault_path)
+        _write_atomic(note_path, note_content)
+            
+        logging.info("NoteManager saved note to: %s", note_path)
+        return {
+            'note_path': str(note_path),
+            'attachment_path': str(attachment_path) if attachment_path else None,
+            'date_time': date_time
+        }
+
+    def update_note(self, note_info: Dict, processed_content: Dict) -> Dict:
+        """
+        Rewrite a note created by create_note with new processed content.
+        The note is renamed if the title changed; the attachment is left in place.
+        
+        Args:
+            note_info: Dictionary returned by create_note
+            processed_content: Dictionary containing the new title, tags, etc.
+        """
+        vault_path = self.vault_path
+        old_path = Path(note_info['note_path'])
+        attachment_path = Path(note_info['attachment_path']) if note_info.get('attachment_path') else None
+        
+        title = processed_content.get('title', 'Untitled Note')
+        safe_title = _safe_title(title)
+        note_path = old_path.with_name(f"{note_info['date_time']}_{safe_title}.md")
+        
+        note_content = self._build_content(processed_content, attachment_path, vault_path)
+        _write_atomic(note_path, note_content)
+        if note_path != old_path:
+            old_path.unlink(missing_ok=True)
+            
+        logging.info("NoteManager updated note: %s", note_path)
+        return dict(note_info, note_path=str(note_path))
+
+    def _build_content(self, processed_content: Dict, attachment_path: Optional[Path], vault_path: Path) -> str:
         content_lines = []
-        content_lines.append(f"# {title}")
+        content_lines.append(f"# {processed_content.get('title', 'Untitled Note')}")
         content_lines.append(f"Tags: {', '.join(processed_content.get('tags', []))}")
         content_lines.append("")
         content_lines.append(f"**Summary**: {processed_content.get('ai_summary', 'No summary')}")
@@ -115,8 +159,4 @@ class NoteManager:
             content_lines.append("")
             content_lines.append(formatted)
         
-        with open(note_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content_lines))
-            
-        logging.info(f"NoteManager saved note to: {note_path}")
-        return {'note_path': str(note_path)}
+        return '\n'.join(content_lines)
@@ -12,33 +12,36 @@ def create_router(agent):
     @router.get("/config")
     async def get_config():
         return {
-            "watch_path": await agent.get_memory("watch_path") or "",
-            "dest_path": await agent.get_memory("dest_path") or "",
-            "polling_enabled": await agent.get_memory("polling_enabled") or "false",
-            "polling_interval": await agent.get_memory("polling_interval") or str(agent.polling_interval),
-            "scan_enabled": await agent.get_memory("scan_enabled") or "false",
-            "scan_interval": await agent.get_memory("scan_interval") or str(agent.scan_interval)
+            "watch_path": agent.watch_path or "",
+            "dest_path": agent.dest_path or "",
+            "polling_enabled": str(agent.polling_enabled).lower(),
+            "polling_interval": str(agent.polling_interval),
+            "scan_enabled": str(agent.scan_enabled).lower(),
+            "scan_interval": str(agent.scan_interval)
         }
 
     @router.post("/config")
     async def update_config(config: ConfigRequest):
-        await agent.save_memory("watch_path", config.watch_path)
-        await agent.save_memory("dest_path", config.dest_path)
+        await agent.process_task({
+            "action": "configure",
+            "watch_path": config.watch_path,
+            "dest_path": config.dest_path
+        })
         
-        # Restart watcher with new paths
-        await agent.start_watching()
+        # configure only restarts the watcher when scanning is enabled
+        if not agent.observer:
+            await agent.start_watching()
         return {"status": "updated"}
 
     @router.get("/logs")
     async def get_logs():
-        return agent.logs
+        return list(agent.logs)
 
     @router.post("/scan")
     async def trigger_scan():
+        if not agent.start_scan():
+            return {"status": "already_scanning"}
         await agent.log_to_ui("Manual scan triggered.")
-        # Trigger scan in background or await it? 
-        # Await for now to keep it simple, though background task is better for long scans
-        await agent.scan_folder()
         return {"status": "scanning_started"}
 
     return router
@@ -0,0 +1,48 @@
+import ast
+import re
+import sys
+from datetime import datetime, MINYEAR
+from pathlib import Path
+from typing import Optional
+
+# audio_processor.py uses package-relative imports, so pull just the date
+# parsing definitions out of its source instead of importing the module
+source = (Path(__file__).parent / "processors" / "audio_processor.py").read_text()
+tree = ast.parse(source)
+wanted = [node for node in tree.body
+          if (isinstance(node, ast.FunctionDef) and node.name == "_parse_date")
+          or (isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "_DATE_RE" for t in node.targets))]
+namespace = {"re": re, "datetime": datetime, "MINYEAR": MINYEAR, "Optional": Optional}
+exec(compile(ast.Module(body=wanted, type_ignores=[]), "audio_processor.py", "exec"), namespace)
+_parse_date = namespace["_parse_date"]
+
+test_cases = [
+    ("2023", datetime(2023, 1, 1)),
+    ("2023-05-17", datetime(2023, 5, 17)),
+    ("2023/05/17", datetime(2023, 5, 17)),
+    ("2023-05-17T14:30", datetime(2023, 5, 17, 14, 30)),
+    ("2023-05-17 14:30:45", datetime(2023, 5, 17, 14, 30, 45)),
+    (" 2023-05-17 ", datetime(2023, 5, 17)),
+    ("2023-13-01", datetime(2023, 1, 1)),
+    ("2023-02-30", datetime(2023, 1, 1)),
+    ("0000", None),
+    ("0000-00-00", None),
+    ("", None),
+    ("unknown", None),
+]
+
+failed = 0
+for value, expected in test_cases:
+    result = _parse_date(value)
+    if result != expected:
+        print(f"FAILED: input={repr(value)}, expected={repr(expected)}, got={repr(result)}")
+        failed += 1
+    else:
+        print(f"PASSED: input={repr(value)} -> {repr(result)}")
+
+if failed == 0:
+    print("\nAll tests passed!")
+    sys.exit(0)
+else:
+    print(f"\n{failed} tests failed.")
+    sys.exit(1)
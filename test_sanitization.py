@@ -6,8 +6,8 @@ def sanitize_path(path: str) -> str:
     if not path:
         return None
     s = path.strip()
-    if (s.startswith('"') and s.endswith('"')) or (s.startswith("'") and s.endswith("'")):
-        s = s[1:-1].strip()
+    if len(s) >= 2 and s[0] == s[-1] and s[0] in ('"', "'"):
+        return s[1:-1].strip()
     return s
 
 test_cases = [
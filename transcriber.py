@@ -5,14 +5,35 @@ import warnings
 import logging
 import os
 import json
+import shutil
 import subprocess
 import tempfile
 
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 # Filter out specific Whisper warnings about Triton/CUDA
 warnings.filterwarnings('ignore', message='Failed to launch Triton kernels')
 
+# Resolved once; without ffprobe the duration probe is skipped instead of failing per file
+FFPROBE_PATH = shutil.which('ffprobe')
+
 class WhisperTranscriber:
-    def __init__(self, model_size=None, lazy_load=False):
+    """
+    Whisper speech-to-text, configured through environment variables:
+        WHISPER_MODEL_SIZE: Model to load (default "medium")
+        WHISPER_BACKEND: "auto" (default) uses faster-whisper when installed;
+            "openai" forces openai-whisper
+        WHISPER_COMPUTE_TYPE: faster-whisper quantization (default "float16"
+            on CUDA, "int8" otherwise)
+        WHISPER_CHUNK_THRESHOLD, WHISPER_CHUNK_DURATION, WHISPER_CHUNK_OVERLAP:
+            Chunking settings in seconds (defaults 240, 30, 5); chunking is not
+            implemented yet, longer recordings are still transcribed in one pass
+    """
+    def __init__(self, model_size=None, lazy_load=False, compute_type=None):
         if model_size is None:
             model_size = os.getenv('WHISPER_MODEL_SIZE', 'medium')
         
@@ -20,6 +41,13 @@ class WhisperTranscriber:
         self.model_size = model_size
         self.model = None
         
+        # faster-whisper (CTranslate2) runs quantized models: int8 roughly halves
+        # memory and speeds up CPU inference. Falls back to openai-whisper.
+        self.use_faster_whisper = FASTER_WHISPER_AVAILABLE and os.getenv('WHISPER_BACKEND', 'auto') != 'openai'
+        if compute_type is None:
+            compute_type = os.getenv('WHISPER_COMPUTE_TYPE') or ("float16" if self.device == "cuda" else "int8")
+        self.compute_type = compute_type
+        
         # Chunking configuration
         self.chunk_threshold_seconds = float(os.getenv('WHISPER_CHUNK_THRESHOLD', '240'))
         self.chunk_duration_seconds = float(os.getenv('WHISPER_CHUNK_DURATION', '30'))
@@ -43,14 +71,18 @@ class WhisperTranscriber:
     def _load_model(self):
         if self.model is not None:
             return
-        logging.info(f"Loading Whisper model: {self.model_size}")
+        logging.info("Loading Whisper model: %s", self.model_size)
+        if self.use_faster_whisper:
+            self.model = WhisperModel(self.model_size, device=self.device, compute_type=self.compute_type)
+            logging.info("Whisper model loaded on device: %s (faster-whisper, %s)", self.device, self.compute_type)
+            return
         self.model = whisper.load_model(self.model_size).to(self.device)
-        logging.info(f"Whisper model loaded on device: {self.device}")
+        logging.info("Whisper model loaded on device: %s", self.device)
     
     def unload_model(self):
         if self.model is None:
             return
-        if self.device == "cuda":
+        if self.device == "cuda" and not self.use_faster_whisper:
             self.model = self.model.cpu()
             torch.cuda.empty_cache()
         del self.model
@@ -64,7 +96,7 @@ class WhisperTranscriber:
         # Assuming single file for MVP or short clips
         duration = self._get_audio_duration(audio_path)
         if duration > self.chunk_threshold_seconds and duration != float('inf'):
-             logging.info(f"Audio file > {self.chunk_threshold_seconds}s, using simple transcription anyway for MVP stability.")
+             logging.info("Audio file > %ss, using simple transcription anyway for MVP stability.", self.chunk_threshold_seconds)
         
         return self._transcribe_single(audio_path)
 
@@ -73,13 +105,15 @@ class WhisperTranscriber:
             self._load_model()
 
     def _get_audio_duration(self, audio_path: Path) -> float:
+        if FFPROBE_PATH is None:
+            return float('inf')
         try:
-            cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'json', str(audio_path)]
+            cmd = [FFPROBE_PATH, '-v', 'error', '-show_entries', 'format=duration', '-of', 'json', str(audio_path)]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=10, check=True)
             data = json.loads(result.stdout)
             return float(data['format']['duration'])
         except Exception as e:
-            logging.warning(f"Could not determine audio duration: {e}")
+            logging.warning("Could not determine audio duration: %s", e)
             return float('inf')
 
     def _transcribe_single(self, audio_path: Path) -> dict:
@@ -92,9 +126,20 @@ class WhisperTranscriber:
             "task": "transcribe",
             "initial_prompt": self.default_prompt,
             "condition_on_previous_text": False,
-            "word_timestamps": True,
+            "word_timestamps": False,
         }
         
+        if self.use_faster_whisper:
+            # fp16 is implied by compute_type; segments are produced lazily
+            options.pop("fp16")
+            segments, info = self.model.transcribe(str(audio_path), **options)
+            segments = list(segments)
+            return {
+                "text": "".join(segment.text for segment in segments).strip(),
+                "language": info.language or "unknown",
+                "segments": segments
+            }
+        
         result = self.model.transcribe(str(audio_path), **options)
         
         return {